@@ -0,0 +1,88 @@
+from datetime import datetime, time, timedelta
+
+# Bookings made before appointments recorded their length took one hour
+LEGACY_BOOKING_MINUTES = 60
+
+
+def parse_time(value):
+    return datetime.strptime(value, '%H:%M').time()
+
+
+def parse_breaks(value):
+    # "12:00-14:00,16:30-17:00"
+    breaks = []
+    for part in (value or '').split(','):
+        if part.strip():
+            start, end = part.split('-')
+            breaks.append((parse_time(start.strip()), parse_time(end.strip())))
+    return breaks
+
+
+class Schedule:
+    """Working hours of one doctor: slots of `slot_minutes` between `start`
+    and `end`, minus `breaks`, on the given weekdays (Monday is 0)."""
+
+    def __init__(self, start=time(9), end=time(17), slot_minutes=60, breaks=((time(12), time(14)),), weekdays=range(7)):
+        self.start = start
+        self.end = end
+        self.slot_minutes = slot_minutes
+        self.breaks = list(breaks)
+        self.weekdays = frozenset(weekdays)
+
+        start_minute = start.hour * 60 + start.minute
+        end_minute = end.hour * 60 + end.minute
+        break_ranges = [(b.hour * 60 + b.minute, e.hour * 60 + e.minute) for b, e in self.breaks]
+        self.slots = []
+        self._starts = []
+        self._index = {}
+        for minute in range(start_minute, end_minute - slot_minutes + 1, slot_minutes):
+            if any(b < minute + slot_minutes and minute < e for b, e in break_ranges):
+                continue
+            self._index[minute] = len(self.slots)
+            self._starts.append(minute)
+            self.slots.append(time(minute // 60, minute % 60))
+        self.full_mask = (1 << len(self.slots)) - 1
+
+    def works_on(self, day):
+        return day.weekday() in self.weekdays
+
+    def slot_index(self, moment):
+        """Index of the slot starting at `moment`, or None if it is not a slot start."""
+        return self._index.get(moment.hour * 60 + moment.minute)
+
+    def overlap_mask(self, moment, minutes):
+        """Bits of the slots overlapping `minutes` starting at `moment`, on the same day."""
+        start = moment.hour * 60 + moment.minute
+        end = start + minutes
+        mask = 0
+        for i, slot_start in enumerate(self._starts):
+            if slot_start < end and start < slot_start + self.slot_minutes:
+                mask |= 1 << i
+        return mask
+
+    def day_mask(self, day):
+        # Bits of the slots that exist on this day
+        return self.full_mask if self.works_on(day) else 0
+
+    def free_slots(self, day, booked_bits):
+        free = self.day_mask(day) & ~booked_bits
+        return [slot for i, slot in enumerate(self.slots) if free >> i & 1]
+
+
+DEFAULT_SCHEDULE = Schedule()
+
+
+def booked_bitmaps(schedule, bookings):
+    """Fold booked (start, minutes) pairs into one bitmap per day (bit i = slot i
+    overlaps a booking). Bookings need not start on a slot of the current schedule."""
+    bitmaps = {}
+    for moment, minutes in bookings:
+        mask = schedule.overlap_mask(moment, minutes or LEGACY_BOOKING_MINUTES)
+        if mask:
+            day = moment.date()
+            bitmaps[day] = bitmaps.get(day, 0) | mask
+    return bitmaps
+
+
+def days_from(start_day, count):
+    return [start_day + timedelta(days=offset) for offset in range(count)]
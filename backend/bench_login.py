@@ -0,0 +1,94 @@
+"""Login storm benchmark against a running server.
+
+Measures the latency of a cheap unrelated request (GET /api/doctors) on its
+own, then again while many clients log in at once, and reports logins/sec.
+With bcrypt on the event loop the second p99 climbs to several bcrypt
+rounds; with hashing on the password executor it should stay close to the
+baseline.
+
+    gunicorn --worker-class gevent -w 1 --bind 0.0.0.0:5000 api:app
+    python bench_login.py --url http://localhost:5000 --clients 20 --seconds 15
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+def call(url, payload=None):
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)] * 1000
+
+
+def probe(url, stop, interval):
+    # Sequential GETs, like one user browsing while others log in
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        call(f'{url}/api/doctors?limit=5')
+        latencies.append(time.perf_counter() - started)
+        time.sleep(interval)
+    return latencies
+
+
+def report(label, latencies):
+    print(f'{label}: {len(latencies)} requests, p50 {percentile(latencies, 0.5):.1f} ms, '
+          f'p99 {percentile(latencies, 0.99):.1f} ms, max {max(latencies) * 1000:.1f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://localhost:5000')
+    parser.add_argument('--clients', type=int, default=20, help='concurrent login loops')
+    parser.add_argument('--seconds', type=float, default=15)
+    parser.add_argument('--interval', type=float, default=0.02, help='pause between probe requests')
+    parser.add_argument('--email', default='john.doe@example.com')
+    parser.add_argument('--password', default='password123')
+    args = parser.parse_args()
+
+    stop = threading.Event()
+    timer = threading.Timer(args.seconds / 3, stop.set)
+    timer.start()
+    report('idle', probe(args.url, stop, args.interval))
+
+    stop = threading.Event()
+    logins = []
+    failures = []
+
+    def storm():
+        credentials = {'email': args.email, 'password': args.password}
+        while not stop.is_set():
+            status = call(f'{args.url}/api/login', credentials)
+            (logins if status == 200 else failures).append(status)
+
+    clients = [threading.Thread(target=storm) for _ in range(args.clients)]
+    started = time.perf_counter()
+    for client in clients:
+        client.start()
+    timer = threading.Timer(args.seconds, stop.set)
+    timer.start()
+    latencies = probe(args.url, stop, args.interval)
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - started
+
+    report(f'during {args.clients}-client login storm', latencies)
+    print(f'logins: {len(logins)} in {elapsed:.1f} s = {len(logins) / elapsed:.1f}/s'
+          + (f', {len(failures)} failed (statuses {sorted(set(failures))})' if failures else ''))
+
+
+if __name__ == '__main__':
+    main()
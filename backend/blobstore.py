@@ -0,0 +1,73 @@
+import hashlib
+import os
+import tempfile
+
+CHUNK_SIZE = 64 * 1024
+
+
+class BlobStore:
+    """Content-addressed file store: each blob lives at <root>/<hash[:2]>/<hash>.
+
+    Writes stream through a temporary file in CHUNK_SIZE pieces, so memory use
+    does not depend on the size of the upload. Identical content is stored once.
+    """
+
+    def __init__(self, root=None):
+        self.root = root
+        if root is not None:
+            os.makedirs(root, exist_ok=True)
+
+    def init_app(self, app):
+        self.root = app.config['BLOB_STORAGE_DIR']
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, content_hash):
+        return os.path.join(self.root, content_hash[:2], content_hash)
+
+    def exists(self, content_hash):
+        return os.path.exists(self.path(content_hash))
+
+    def put_stream(self, stream):
+        """Store everything read from `stream` and return (sha256 hex, size)."""
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    size += len(chunk)
+                    tmp.write(chunk)
+            content_hash = digest.hexdigest()
+            target = self.path(content_hash)
+            if os.path.exists(target):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return content_hash, size
+
+    def put_bytes(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        target = self.path(digest)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.upload-')
+            with os.fdopen(fd, 'wb') as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, target)
+        return digest, len(data)
+
+    def open(self, content_hash):
+        return open(self.path(content_hash), 'rb')
+
+    def read(self, content_hash):
+        with self.open(content_hash) as f:
+            return f.read()
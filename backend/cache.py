@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, factory):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def pop(self, key):
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        return {'size': len(self._data), 'hits': self.hits, 'misses': self.misses}
+
+
+class RedisTTLSet:
+    """The set side of TTLCache (`set` and `in`) kept in Redis, so every worker
+    sees the same keys. Each key expires after its own `ttl`."""
+
+    def __init__(self, client, prefix, ttl=60):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def set(self, key, value=True, ttl=None):
+        ttl = int(self.ttl if ttl is None else ttl)
+        if ttl > 0:
+            self.client.set(self.prefix + str(key), 1, ex=ttl)
+
+    def __contains__(self, key):
+        return self.client.exists(self.prefix + str(key)) > 0
+
+
+def create_ttl_set(url=None, prefix='', maxsize=1024, ttl=60):
+    if url and url.startswith(('redis://', 'rediss://', 'unix://')):
+        import redis
+        return RedisTTLSet(redis.Redis.from_url(url), prefix, ttl)
+    return TTLCache(maxsize, ttl)
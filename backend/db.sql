@@ -4,8 +4,11 @@ USE doctors_db;
 DROP TABLE IF EXISTS document_notes;
 DROP TABLE IF EXISTS documents;
 DROP TABLE IF EXISTS attachments;
+DROP TABLE IF EXISTS notifications_archive;
 DROP TABLE IF EXISTS notifications;
+DROP TABLE IF EXISTS conversations;
 DROP TABLE IF EXISTS messages;
+DROP TABLE IF EXISTS doctor_schedules;
 DROP TABLE IF EXISTS favorites;
 DROP TABLE IF EXISTS appointments;
 DROP TABLE IF EXISTS users;
@@ -41,6 +44,7 @@ CREATE TABLE appointments (
     user_id INT NOT NULL,
     doctor_id INT NOT NULL,
     appointment_date DATETIME NOT NULL,
+    duration_minutes INT,
     status ENUM('Pending', 'Confirmed', 'Completed', 'Cancelled') DEFAULT 'Pending',
     FOREIGN KEY (user_id) REFERENCES users(id),
     FOREIGN KEY (doctor_id) REFERENCES doctors(id)
@@ -77,12 +81,23 @@ CREATE TABLE notifications (
     FOREIGN KEY (user_id) REFERENCES users(id)
 );
 
+CREATE TABLE notifications_archive (
+    id INT PRIMARY KEY,
+    user_id INT NOT NULL,
+    message VARCHAR(200) NOT NULL,
+    created_at DATETIME,
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE attachments (
     id INT AUTO_INCREMENT PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
     type ENUM('note', 'file') NOT NULL,
     description TEXT NOT NULL,
-    content TEXT NOT NULL,
+    content TEXT,
+    content_hash VARCHAR(64),
+    size BIGINT,
+    mime_type VARCHAR(100),
     appid INT NOT NULL,
     extension VARCHAR(10) NULL
 );
@@ -92,7 +107,11 @@ CREATE TABLE documents (
     doctor_id INT NOT NULL,
     name VARCHAR(100) NOT NULL,
     description TEXT,
-    content TEXT NOT NULL, 
+    content TEXT,
+    content_hash VARCHAR(64),
+    size BIGINT,
+    mime_type VARCHAR(100),
+    preview_hash VARCHAR(64),
     extension VARCHAR(10), 
     viewed BOOLEAN DEFAULT FALSE,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -107,6 +126,39 @@ CREATE TABLE document_notes (
     FOREIGN KEY (document_id) REFERENCES documents(id),
     FOREIGN KEY (doctor_id) REFERENCES doctors(id)
 );
+CREATE TABLE conversations (
+    user_low_id INT NOT NULL,
+    user_high_id INT NOT NULL,
+    last_message_id INT,
+    last_message_text TEXT,
+    last_sender_id INT,
+    last_message_at DATETIME,
+    low_unread_count INT NOT NULL DEFAULT 0,
+    high_unread_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_low_id, user_high_id),
+    FOREIGN KEY (user_low_id) REFERENCES users(id),
+    FOREIGN KEY (user_high_id) REFERENCES users(id),
+    FOREIGN KEY (last_message_id) REFERENCES messages(id)
+);
+CREATE TABLE doctor_schedules (
+    doctor_id INT PRIMARY KEY,
+    start_time TIME NOT NULL,
+    end_time TIME NOT NULL,
+    slot_minutes INT NOT NULL DEFAULT 60,
+    breaks VARCHAR(255),
+    weekdays VARCHAR(7) NOT NULL DEFAULT '0123456',
+    FOREIGN KEY (doctor_id) REFERENCES doctors(id)
+);
+CREATE INDEX idx_doctors_specialty ON doctors (specialty);
+CREATE INDEX idx_doctors_city ON doctors (city);
+CREATE INDEX ix_document_notes_document_id ON document_notes (document_id);
+CREATE INDEX ix_attachments_appid ON attachments (appid);
+CREATE INDEX idx_notifications_user_created ON notifications (user_id, created_at, id);
+CREATE INDEX idx_notifications_user_unread ON notifications (user_id, is_read);
+CREATE INDEX ix_notifications_archive_user_id ON notifications_archive (user_id);
+CREATE INDEX idx_messages_pair_sent_at ON messages ((LEAST(sender_id, receiver_id)), (GREATEST(sender_id, receiver_id)), sent_at);
+CREATE INDEX idx_conversations_low_last ON conversations (user_low_id, last_message_at);
+CREATE INDEX idx_conversations_high_last ON conversations (user_high_id, last_message_at);
 -- Insert 50 doctors into doctors table
 INSERT INTO doctors (name, specialty, city, gender, address, phone) VALUES
 ('Dr. Ahmed Ben Salah', 'Cardiology', 'Tunis', 'Male', '123 Avenue Habib Bourguiba', '216-71-123-456'),
@@ -0,0 +1,58 @@
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+logger = logging.getLogger(__name__)
+
+
+def upsert(session, model, values, conflict_columns, update=None, conflict_where=None):
+    """Build a single-statement INSERT that tolerates an existing row.
+
+    Postgres (and SQLite, for tests) get ON CONFLICT, MySQL gets ON DUPLICATE
+    KEY UPDATE. `update` receives the proposed row (`excluded`/`inserted`) and
+    returns the columns to overwrite; without it the conflicting insert is a
+    no-op, and its rowcount tells a new row (1) from an existing one (0).
+    `conflict_where` targets a partial unique index (Postgres only).
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        stmt = (postgresql if dialect == 'postgresql' else sqlite).insert(model).values(values)
+        if update is None:
+            return stmt.on_conflict_do_nothing(index_elements=conflict_columns, index_where=conflict_where)
+        return stmt.on_conflict_do_update(
+            index_elements=conflict_columns, index_where=conflict_where, set_=update(stmt.excluded)
+        )
+    if dialect == 'mysql':
+        if update is None:
+            # Not a no-op ON DUPLICATE KEY UPDATE: SQLAlchemy's MySQL drivers set
+            # CLIENT.FOUND_ROWS, which makes that report 1 row for a duplicate.
+            # IGNORE also turns other errors (e.g. a missing foreign key) into warnings.
+            return mysql.insert(model).values(values).prefix_with('IGNORE')
+        stmt = mysql.insert(model).values(values)
+        # A list keeps the assignments in `update`'s order: MySQL applies them one
+        # by one and later ones see the values set by earlier ones
+        return stmt.on_duplicate_key_update(list(update(stmt.inserted).items()))
+    raise NotImplementedError(f'upsert is not supported on {dialect}')
+
+
+def sync_columns(engine, table, relax=()):
+    """Bring an existing table in line with its model: add missing columns and
+    drop NOT NULL from the columns named in `relax`, which the model must allow
+    to be NULL. Other constraints are left alone and nothing is ever dropped."""
+    existing = {column['name']: column for column in inspect(engine).get_columns(table.name)}
+    with engine.begin() as conn:
+        for column in table.columns:
+            if column.name not in existing:
+                column_type = column.type.compile(dialect=engine.dialect)
+                statement = f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+            elif column.name in relax and column.nullable and not existing[column.name]['nullable']:
+                if engine.dialect.name == 'mysql':
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    statement = f'ALTER TABLE {table.name} MODIFY {column.name} {column_type} NULL'
+                else:
+                    statement = f'ALTER TABLE {table.name} ALTER COLUMN {column.name} DROP NOT NULL'
+            else:
+                continue
+            logger.info(statement)
+            conn.execute(text(statement))
@@ -0,0 +1,68 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class GroupCommitter:
+    """Commits writes coming from many concurrent socket events together.
+
+    `submit` blocks its caller until the batch holding the item is committed.
+    A background task waits at most `max_delay` seconds for up to `max_batch`
+    items, hands them to `flush(items)` (one transaction) and returns each
+    caller its own entry of the list that `flush` returns.
+    """
+
+    def __init__(self, socketio, flush, max_batch=50, max_delay=0.01):
+        self.socketio = socketio
+        self.flush = flush
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = None
+        self._lock = threading.Lock()
+
+    def submit(self, item, timeout=10):
+        eio = self.socketio.server.eio
+        if self._queue is None:
+            with self._lock:
+                if self._queue is None:
+                    # Queue and events come from the async layer Socket.IO runs on:
+                    # stdlib ones would block the whole gevent/eventlet hub, and the
+                    # background task could never run to wake the caller
+                    self._queue = eio.create_queue()
+                    self._empty = eio.get_queue_empty_exception()
+                    self.socketio.start_background_task(self._run)
+        entry = {'item': item, 'done': eio.create_event()}
+        self._queue.put(entry)
+        if not entry['done'].wait(timeout):
+            raise TimeoutError('Batch was not committed in time')
+        if 'error' in entry:
+            raise entry['error']
+        return entry['result']
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except self._empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                for entry, result in zip(batch, self.flush([entry['item'] for entry in batch])):
+                    entry['result'] = result
+            except Exception as e:
+                logger.error(f"Group commit of {len(batch)} items failed: {e}")
+                for entry in batch:
+                    entry['error'] = e
+            for entry in batch:
+                entry['done'].set()
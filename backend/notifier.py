@@ -0,0 +1,39 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SocketEmitter:
+    """Sends socket events from a background task instead of the request.
+
+    Batches are queued after the database commit that produced them, so a
+    client is never told about a row that was rolled back.
+    """
+
+    def __init__(self, socketio):
+        self.socketio = socketio
+        self._queue = None
+        self._lock = threading.Lock()
+
+    def submit(self, event, payloads):
+        if not payloads:
+            return
+        if self._queue is None:
+            with self._lock:
+                if self._queue is None:
+                    # Made by the async layer Socket.IO runs on: the background task
+                    # is a greenlet under gevent/eventlet, and waiting on a stdlib
+                    # queue there blocks the whole hub when nothing is monkey-patched
+                    self._queue = self.socketio.server.eio.create_queue()
+                    self.socketio.start_background_task(self._run)
+        self._queue.put((event, payloads))
+
+    def _run(self):
+        while True:
+            event, payloads = self._queue.get()
+            for payload in payloads:
+                try:
+                    self.socketio.emit(event, payload, room=str(payload['user_id']))
+                except Exception as e:
+                    logger.error(f"Failed to emit {event} to user {payload.get('user_id')}: {e}")
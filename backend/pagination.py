@@ -0,0 +1,128 @@
+import base64
+import json
+from bisect import bisect_right
+from datetime import datetime
+
+from flask import request
+from sqlalchemy import tuple_
+
+DEFAULT_LIMIT = 5
+MAX_LIMIT = 50
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def get_limit(default=DEFAULT_LIMIT):
+    limit = request.args.get('limit', default, type=int)
+    return min(max(limit, 1), MAX_LIMIT)
+
+
+def wants_total(default=True):
+    value = request.args.get('include_total')
+    if value is None:
+        return default
+    return value.lower() not in ('0', 'false', 'no')
+
+
+def encode_cursor(values):
+    values = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(values, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token, types):
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor(token)
+    if not isinstance(values, list) or len(values) != len(types):
+        raise InvalidCursor(token)
+    try:
+        return [datetime.fromisoformat(v) if t is datetime else t(v) for v, t in zip(values, types)]
+    except (ValueError, TypeError):
+        raise InvalidCursor(token)
+
+
+def paginate(query, columns, descending=False):
+    """Page `query` by the request args and return (items, meta).
+
+    Classic `page`/`limit` paging is the default. Passing `after` (empty for
+    the first page) switches to keyset paging on `columns`, which must be a
+    unique sort key; the response then carries `next_cursor` instead of page
+    numbers. `include_total=0` skips the COUNT(*) in either mode.
+    """
+    limit = get_limit()
+    order = [c.desc() for c in columns] if descending else list(columns)
+    query = query.order_by(*order)
+
+    if 'after' not in request.args:
+        page = max(request.args.get('page', 1, type=int), 1)
+        if wants_total():
+            result = query.paginate(page=page, per_page=limit, error_out=False)
+            return result.items, {'total': result.total, 'pages': result.pages, 'page': result.page}
+        items = query.offset((page - 1) * limit).limit(limit + 1).all()
+        return items[:limit], {'page': page, 'has_more': len(items) > limit}
+
+    meta = {}
+    if wants_total(default=False):
+        meta['total'] = query.order_by(None).count()
+    after = request.args.get('after')
+    if after:
+        values = decode_cursor(after, [c.type.python_type for c in columns])
+        key = tuple_(*columns)
+        query = query.filter(key < tuple_(*values) if descending else key > tuple_(*values))
+    items = query.limit(limit + 1).all()
+    has_more = len(items) > limit
+    items = items[:limit]
+    meta['next_cursor'] = encode_cursor([getattr(items[-1], c.key) for c in columns]) if has_more else None
+    return items, meta
+
+
+# Stale entries refilled per window at most this many times
+MAX_REFILLS = 3
+
+
+def fill_window(ranked, start, limit, accept):
+    """Take `limit` entries of `ranked` from `start`, keeping those whose ids
+    `accept(ids)` returns and refilling from the following entries for each
+    one dropped. Returns the window and the index after the last entry read."""
+    if accept is None:
+        return ranked[start:start + limit], min(start + limit, len(ranked))
+    window = []
+    end = start
+    for _ in range(MAX_REFILLS + 1):
+        if len(window) >= limit or end >= len(ranked):
+            break
+        chunk = ranked[end:end + limit - len(window)]
+        end += len(chunk)
+        kept = accept([item_id for _, item_id in chunk])
+        window += [item for item in chunk if item[1] in kept]
+    return window, end
+
+
+def paginate_ranked(ranked, accept=None):
+    """Same contract as `paginate` for an in-memory list of (score, id) pairs
+    already sorted best first. `accept` re-checks the ids of a window against
+    the database (see `fill_window`); totals and page numbers count `ranked`."""
+    limit = get_limit()
+    total = len(ranked)
+
+    if 'after' not in request.args:
+        page = max(request.args.get('page', 1, type=int), 1)
+        window, _ = fill_window(ranked, (page - 1) * limit, limit, accept)
+        return window, {'total': total, 'pages': (total + limit - 1) // limit, 'page': page}
+
+    start = 0
+    after = request.args.get('after')
+    if after:
+        score, doctor_id = decode_cursor(after, [float, int])
+        start = bisect_right(ranked, (-score, doctor_id), key=lambda item: (-item[0], item[1]))
+    window, end = fill_window(ranked, start, limit, accept)
+    has_more = end < total
+    meta = {'next_cursor': encode_cursor(list(ranked[end - 1])) if has_more else None}
+    if wants_total(default=False):
+        meta['total'] = total
+    return window, meta
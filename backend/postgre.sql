@@ -8,8 +8,11 @@
 DROP TABLE IF EXISTS document_notes;
 DROP TABLE IF EXISTS documents;
 DROP TABLE IF EXISTS attachments;
+DROP TABLE IF EXISTS notifications_archive;
 DROP TABLE IF EXISTS notifications;
+DROP TABLE IF EXISTS conversations;
 DROP TABLE IF EXISTS messages;
+DROP TABLE IF EXISTS doctor_schedules;
 DROP TABLE IF EXISTS favorites;
 DROP TABLE IF EXISTS appointments;
 DROP TABLE IF EXISTS users;
@@ -57,6 +60,7 @@ CREATE TABLE appointments (
     user_id INTEGER NOT NULL,
     doctor_id INTEGER NOT NULL,
     appointment_date TIMESTAMP NOT NULL,
+    duration_minutes INTEGER,
     status appointment_status DEFAULT 'Pending',
     CONSTRAINT fk_user_id FOREIGN KEY (user_id) REFERENCES users(id),
     CONSTRAINT fk_doctor_id FOREIGN KEY (doctor_id) REFERENCES doctors(id)
@@ -96,13 +100,25 @@ CREATE TABLE notifications (
     CONSTRAINT fk_user_id FOREIGN KEY (user_id) REFERENCES users(id)
 );
 
+-- Read notifications past the retention period (flask --app api archive-notifications)
+CREATE TABLE notifications_archive (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    message VARCHAR(200) NOT NULL,
+    created_at TIMESTAMP,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Create attachments table
 CREATE TABLE attachments (
     id SERIAL PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
     type attachment_type NOT NULL,
     description TEXT NOT NULL,
-    content TEXT NOT NULL,
+    content TEXT,
+    content_hash VARCHAR(64),
+    size BIGINT,
+    mime_type VARCHAR(100),
     appid INTEGER NOT NULL,
     extension VARCHAR(10),
     CONSTRAINT fk_appid FOREIGN KEY (appid) REFERENCES appointments(id)
@@ -115,7 +131,11 @@ CREATE TABLE documents (
     doctor_id INTEGER NOT NULL,
     name VARCHAR(100) NOT NULL,
     description TEXT,
-    content TEXT NOT NULL,
+    content TEXT,
+    content_hash VARCHAR(64),
+    size BIGINT,
+    mime_type VARCHAR(100),
+    preview_hash VARCHAR(64),
     extension VARCHAR(10),
     viewed BOOLEAN DEFAULT FALSE,
     CONSTRAINT fk_user_id FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -133,6 +153,46 @@ CREATE TABLE document_notes (
     CONSTRAINT fk_doctor_id FOREIGN KEY (doctor_id) REFERENCES doctors(id)
 );
 
+-- Create conversations table (one row per user pair, low id first)
+CREATE TABLE conversations (
+    user_low_id INTEGER NOT NULL,
+    user_high_id INTEGER NOT NULL,
+    last_message_id INTEGER,
+    last_message_text TEXT,
+    last_sender_id INTEGER,
+    last_message_at TIMESTAMP,
+    low_unread_count INTEGER NOT NULL DEFAULT 0,
+    high_unread_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_low_id, user_high_id),
+    CONSTRAINT fk_user_low_id FOREIGN KEY (user_low_id) REFERENCES users(id),
+    CONSTRAINT fk_user_high_id FOREIGN KEY (user_high_id) REFERENCES users(id),
+    CONSTRAINT fk_last_message_id FOREIGN KEY (last_message_id) REFERENCES messages(id)
+);
+
+-- Create doctor_schedules table (doctors without a row use the default 09:00-17:00, lunch 12:00-14:00)
+CREATE TABLE doctor_schedules (
+    doctor_id INTEGER PRIMARY KEY,
+    start_time TIME NOT NULL,
+    end_time TIME NOT NULL,
+    slot_minutes INTEGER NOT NULL DEFAULT 60,
+    breaks VARCHAR(255),
+    weekdays VARCHAR(7) NOT NULL DEFAULT '0123456',
+    CONSTRAINT fk_doctor_id FOREIGN KEY (doctor_id) REFERENCES doctors(id)
+);
+
+-- Create indexes
+CREATE INDEX idx_doctors_specialty ON doctors (specialty);
+CREATE INDEX idx_doctors_city ON doctors (city);
+CREATE INDEX ix_document_notes_document_id ON document_notes (document_id);
+CREATE INDEX ix_attachments_appid ON attachments (appid);
+CREATE INDEX idx_notifications_user_created ON notifications (user_id, created_at, id);
+CREATE INDEX idx_notifications_user_unread ON notifications (user_id, is_read);
+CREATE INDEX ix_notifications_archive_user_id ON notifications_archive (user_id);
+CREATE UNIQUE INDEX uq_appointments_doctor_slot ON appointments (doctor_id, appointment_date) WHERE status <> 'Cancelled';
+CREATE INDEX idx_messages_pair_sent_at ON messages (LEAST(sender_id, receiver_id), GREATEST(sender_id, receiver_id), sent_at);
+CREATE INDEX idx_conversations_low_last ON conversations (user_low_id, last_message_at);
+CREATE INDEX idx_conversations_high_last ON conversations (user_high_id, last_message_at);
+
 -- Insert 50 doctors into doctors table
 INSERT INTO doctors (name, specialty, city, gender, address, phone) VALUES
 ('Dr. Ahmed Ben Salah', 'Cardiology', 'Tunis', 'Male', '123 Avenue Habib Bourguiba', '216-71-123-456'),
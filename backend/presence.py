@@ -0,0 +1,139 @@
+import threading
+import time
+
+# Open chats of a socket whose worker died without disconnecting it are dropped
+# after this long; `ttl` alone decides whether a user still counts as present
+KEY_TTL = 24 * 3600
+
+
+class LocalPresence:
+    """Which chats each user has open, for one process.
+
+    A user may be connected from several sockets; a chat counts as open while
+    any of them has it open and the user was seen within `ttl` seconds. Every
+    call but `disconnect` counts as seeing the user. The caller passes the
+    user of the socket (from its session) to each call.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._sid_chats = {}   # sid -> {room}
+        self._chat_sids = {}   # (user_id, room) -> {sid}
+        self._seen = {}        # user_id -> timestamp
+
+    def connect(self, sid, user_id):
+        with self._lock:
+            self._sid_chats.setdefault(sid, set())
+            self._seen[user_id] = time.time()
+
+    def open_chat(self, sid, user_id, room):
+        with self._lock:
+            self._sid_chats.setdefault(sid, set()).add(room)
+            self._chat_sids.setdefault((user_id, room), set()).add(sid)
+            self._seen[user_id] = time.time()
+
+    def close_chat(self, sid, user_id, room):
+        with self._lock:
+            self._sid_chats.get(sid, set()).discard(room)
+            self._drop(user_id, room, sid)
+            self._seen[user_id] = time.time()
+
+    def disconnect(self, sid, user_id):
+        with self._lock:
+            for room in self._sid_chats.pop(sid, ()):
+                self._drop(user_id, room, sid)
+
+    def heartbeat(self, sid, user_id):
+        with self._lock:
+            self._seen[user_id] = time.time()
+
+    def in_chat(self, user_id, room):
+        return bool(self._chat_sids.get((user_id, room))) and time.time() - self._seen.get(user_id, 0) < self.ttl
+
+    def last_seen(self, user_id):
+        return self._seen.get(user_id)
+
+    def _drop(self, user_id, room, sid):
+        sids = self._chat_sids.get((user_id, room))
+        if sids is not None:
+            sids.discard(sid)
+            if not sids:
+                del self._chat_sids[(user_id, room)]
+
+
+class RedisPresence:
+    """Same interface as LocalPresence, shared by every worker through Redis.
+
+    The rooms a socket has open are kept under the socket, so `disconnect`
+    can remove it from each of them. Every call refreshes the socket's keys;
+    they expire `key_ttl` seconds after the last one, so sockets of a worker
+    that died without cleaning up disappear on their own.
+    """
+
+    def __init__(self, client, ttl=300, prefix='presence:', key_ttl=KEY_TTL):
+        self.client = client
+        self.ttl = ttl
+        self.key_ttl = max(key_ttl, ttl)
+        self.prefix = prefix
+
+    def _key(self, *parts):
+        return self.prefix + ':'.join(str(part) for part in parts)
+
+    def _touch(self, pipe, sid, user_id, rooms=()):
+        pipe.expire(self._key('sid_chats', sid), self.key_ttl)
+        for room in rooms:
+            pipe.expire(self._key('chat', user_id, room), self.key_ttl)
+        pipe.set(self._key('seen', user_id), time.time(), ex=self.ttl)
+
+    def _rooms(self, sid):
+        return [room.decode() for room in self.client.smembers(self._key('sid_chats', sid))]
+
+    def connect(self, sid, user_id):
+        pipe = self.client.pipeline()
+        self._touch(pipe, sid, user_id)
+        pipe.execute()
+
+    def open_chat(self, sid, user_id, room):
+        pipe = self.client.pipeline()
+        pipe.sadd(self._key('chat', user_id, room), sid)
+        pipe.sadd(self._key('sid_chats', sid), room)
+        self._touch(pipe, sid, user_id, [room])
+        pipe.execute()
+
+    def close_chat(self, sid, user_id, room):
+        pipe = self.client.pipeline()
+        pipe.srem(self._key('chat', user_id, room), sid)
+        pipe.srem(self._key('sid_chats', sid), room)
+        self._touch(pipe, sid, user_id)
+        pipe.execute()
+
+    def disconnect(self, sid, user_id):
+        pipe = self.client.pipeline()
+        for room in self._rooms(sid):
+            pipe.srem(self._key('chat', user_id, room), sid)
+        pipe.delete(self._key('sid_chats', sid))
+        pipe.execute()
+
+    def heartbeat(self, sid, user_id):
+        rooms = self._rooms(sid)
+        pipe = self.client.pipeline()
+        self._touch(pipe, sid, user_id, rooms)
+        pipe.execute()
+
+    def in_chat(self, user_id, room):
+        pipe = self.client.pipeline()
+        pipe.exists(self._key('chat', user_id, room))
+        pipe.exists(self._key('seen', user_id))
+        return all(pipe.execute())
+
+    def last_seen(self, user_id):
+        seen = self.client.get(self._key('seen', user_id))
+        return float(seen) if seen is not None else None
+
+
+def create_presence(url=None, ttl=300):
+    if url and url.startswith(('redis://', 'rediss://', 'unix://')):
+        import redis
+        return RedisPresence(redis.Redis.from_url(url), ttl)
+    return LocalPresence(ttl)
@@ -0,0 +1,69 @@
+import io
+import logging
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import fitz  # PyMuPDF, only needed for PDF previews
+except ImportError:
+    fitz = None
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_MAX_SIZE = 320
+PREVIEW_MIME_TYPE = 'image/jpeg'
+
+
+def can_preview(mime_type):
+    if Image is None or not mime_type:
+        return False
+    if mime_type == 'application/pdf':
+        return fitz is not None
+    return mime_type.startswith('image/')
+
+
+def render_preview(path, mime_type):
+    """JPEG thumbnail of an image, or of the first page of a PDF, as bytes."""
+    if mime_type == 'application/pdf':
+        with fitz.open(path) as pdf:
+            pixmap = pdf[0].get_pixmap(dpi=72)
+            image = Image.frombytes('RGB', (pixmap.width, pixmap.height), pixmap.samples)
+    else:
+        image = Image.open(path)
+        image.draft('RGB', (PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE))
+    image.thumbnail((PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE))
+    output = io.BytesIO()
+    image.convert('RGB').save(output, 'JPEG', quality=80)
+    return output.getvalue()
+
+
+class PreviewPipeline:
+    """Renders previews on a worker pool after the upload has returned.
+
+    `spawn` starts a cooperative background task that waits for the pool, then
+    `on_ready(key, preview_hash)` records the stored preview.
+    """
+
+    def __init__(self, blob_store, executor, spawn, on_ready):
+        self.blob_store = blob_store
+        self.executor = executor
+        self.spawn = spawn
+        self.on_ready = on_ready
+
+    def submit(self, key, content_hash, mime_type):
+        if can_preview(mime_type):
+            self.spawn(self._run, key, content_hash, mime_type)
+
+    def _render(self, content_hash, mime_type):
+        data = render_preview(self.blob_store.path(content_hash), mime_type)
+        return self.blob_store.put_bytes(data)[0]
+
+    def _run(self, key, content_hash, mime_type):
+        try:
+            preview_hash = self.executor.submit(self._render, content_hash, mime_type).result()
+            self.on_ready(key, preview_hash)
+        except Exception as e:
+            logger.error(f"Preview failed for {key}: {e}")
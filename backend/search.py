@@ -0,0 +1,210 @@
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+
+# Honorific stripped from names so every doctor does not share the same grams
+TITLE_PREFIXES = ('dr. ', 'dr ')
+# Share of the query's trigrams a name must contain to count as a fuzzy match
+MIN_COVERAGE = 0.5
+# Query words shorter than this have no trigram of their own to look up
+MIN_GRAM_WORD = 3
+
+
+def normalize(text):
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return ' '.join(text.lower().split())
+
+
+def normalize_name(name):
+    name = normalize(name) + ' '
+    for prefix in TITLE_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix):].strip()
+    return name.strip()
+
+
+def word_trigrams(text):
+    # Same padding as pg_trgm: two spaces before each word, one after
+    grams = set()
+    for word in text.split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def short_substrings(text):
+    # Every one- and two-letter piece of each word, for queries too short for a trigram
+    pieces = set()
+    for word in text.split():
+        for size in range(1, MIN_GRAM_WORD):
+            pieces.update(word[i:i + size] for i in range(len(word) - size + 1))
+    return pieces
+
+
+def query_trigrams(text):
+    # Only pad the front so a partially typed word still matches its prefix
+    grams = set()
+    for word in text.split():
+        if len(word) >= MIN_GRAM_WORD:
+            grams.update(word[i:i + 3] for i in range(len(word) - 2))
+        else:
+            padded = f'  {word}'
+            grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class DoctorSearchIndex:
+    """Trigram index on doctor names plus postings for specialty and city.
+
+    `loader` returns (id, name, specialty, city) rows. The index is built on
+    first use and rebuilt after `max_age` seconds so changes made by other
+    processes are picked up; local writes go through `upsert`/`remove`.
+    Only one rebuild runs at a time, through `spawn(fn)` when given, and
+    searches keep using the current index until the new one is swapped in.
+    """
+
+    def __init__(self, loader, max_age=300, spawn=None):
+        self._loader = loader
+        self._max_age = max_age
+        self._spawn = spawn
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._built_at = None
+        self._reset()
+
+    def _reset(self):
+        self._docs = {}
+        self._grams = defaultdict(set)
+        self._short = defaultdict(set)
+        self._specialties = defaultdict(set)
+        self._cities = defaultdict(set)
+
+    def _add(self, doctor_id, name, specialty, city):
+        name = normalize_name(name)
+        grams = word_trigrams(name)
+        specialty = normalize(specialty)
+        city = normalize(city)
+        self._docs[doctor_id] = (name, len(grams), specialty, city)
+        for gram in grams:
+            self._grams[gram].add(doctor_id)
+        for piece in short_substrings(name):
+            self._short[piece].add(doctor_id)
+        self._specialties[specialty].add(doctor_id)
+        self._cities[city].add(doctor_id)
+
+    def _discard(self, doctor_id):
+        doc = self._docs.pop(doctor_id, None)
+        if doc is None:
+            return
+        name, _, specialty, city = doc
+        for gram in word_trigrams(name):
+            self._grams[gram].discard(doctor_id)
+        for piece in short_substrings(name):
+            self._short[piece].discard(doctor_id)
+        self._specialties[specialty].discard(doctor_id)
+        self._cities[city].discard(doctor_id)
+
+    def rebuild(self):
+        # Load and index outside the lock, then swap
+        staging = DoctorSearchIndex(self._loader)
+        for row in self._loader():
+            staging._add(*row)
+        with self._lock:
+            self._docs, self._grams, self._short = staging._docs, staging._grams, staging._short
+            self._specialties, self._cities = staging._specialties, staging._cities
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self):
+        if self._built_at is None:
+            # Nothing to serve yet: one caller builds, the others wait for it
+            with self._refresh_lock:
+                if self._built_at is None:
+                    self.rebuild()
+            return
+        if time.monotonic() - self._built_at <= self._max_age:
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            return  # another caller is already rebuilding
+
+        def refresh():
+            try:
+                self.rebuild()
+            finally:
+                self._refresh_lock.release()
+
+        if self._spawn is None:
+            refresh()
+            return
+        try:
+            self._spawn(refresh)
+        except Exception:
+            self._refresh_lock.release()
+            raise
+
+    def upsert(self, doctor_id, name, specialty, city):
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._discard(doctor_id)
+            self._add(doctor_id, name, specialty, city)
+
+    def remove(self, doctor_id):
+        with self._lock:
+            self._discard(doctor_id)
+
+    def search(self, name='', specialty='', city=''):
+        """Return (score, doctor_id) pairs, best match first."""
+        self.ensure_fresh()
+        name = normalize_name(name)
+        with self._lock:
+            filters = []
+            if specialty:
+                filters.append(self._specialties.get(normalize(specialty), set()))
+            if city:
+                filters.append(self._cities.get(normalize(city), set()))
+            allowed = None
+            if filters:
+                filters.sort(key=len)
+                allowed = set(filters[0]).intersection(*filters[1:])
+
+            if not name:
+                ids = allowed if allowed is not None else self._docs.keys()
+                return [(1.0, doctor_id) for doctor_id in sorted(ids)]
+
+            grams = query_trigrams(name)
+            hits = defaultdict(int)
+            for gram in grams:
+                for doctor_id in self._grams.get(gram, ()):
+                    if allowed is None or doctor_id in allowed:
+                        hits[doctor_id] += 1
+
+            if all(len(word) < MIN_GRAM_WORD for word in name.split()):
+                # Only short words: they may sit in the middle of a name, where no
+                # gram finds them, so look them up among the short pieces (like the
+                # old ILIKE). A longer word's grams already find every substring match.
+                postings = sorted((self._short.get(word, set()) for word in name.split()), key=len)
+                if allowed is not None:
+                    postings.insert(0, allowed)
+                    postings.sort(key=len)
+                for doctor_id in postings[0]:
+                    if doctor_id not in hits and all(doctor_id in posting for posting in postings[1:]) \
+                            and name in self._docs[doctor_id][0]:
+                        hits[doctor_id] = 0
+
+            results = []
+            for doctor_id, shared in hits.items():
+                doc_name, doc_gram_count, _, _ = self._docs[doctor_id]
+                if name in doc_name:
+                    # Substring matches (the old ILIKE behaviour) rank first, closest names on top
+                    score = 2.0 + shared / (len(grams) + doc_gram_count - shared)
+                else:
+                    score = shared / len(grams)
+                    if score < MIN_COVERAGE:
+                        continue
+                results.append((score, doctor_id))
+        results.sort(key=lambda item: (-item[0], item[1]))
+        return results
@@ -0,0 +1,69 @@
+"""Concurrent booking stress test against a running server.
+
+Fires many bookings of the same doctor and slot at once and checks that
+exactly one succeeds (201) and the rest are refused (409). The slot must be
+free and valid for the doctor's schedule before the run.
+
+    python stress_booking.py --url http://localhost:5000 --doctor-id 1 \\
+        --slot "2030-01-07 10:00" --requests 300
+"""
+import argparse
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+def post(url, payload, token=None):
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'), headers=headers, method='POST')
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, json.loads(response.read() or b'{}')
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b'{}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://localhost:5000')
+    parser.add_argument('--doctor-id', type=int, required=True)
+    parser.add_argument('--slot', required=True, help='YYYY-MM-DD HH:MM, a free slot start')
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--email', default='john.doe@example.com')
+    parser.add_argument('--password', default='password123')
+    args = parser.parse_args()
+
+    status, body = post(f'{args.url}/api/login', {'email': args.email, 'password': args.password})
+    if status != 200:
+        sys.exit(f'Login failed ({status}): {body}')
+    token = body['access_token']
+
+    # Every worker waits here so the bookings hit the server together
+    barrier = threading.Barrier(args.requests)
+    payload = {'doctor_id': args.doctor_id, 'appointment_date': args.slot}
+
+    def book(_):
+        barrier.wait()
+        return post(f'{args.url}/api/appointments/book', payload, token)
+
+    with ThreadPoolExecutor(max_workers=args.requests) as pool:
+        results = list(pool.map(book, range(args.requests)))
+
+    statuses = Counter(status for status, _ in results)
+    print(f'{args.requests} bookings: ' + ', '.join(f'{count} x {status}' for status, count in sorted(statuses.items())))
+    created = [body['appointment']['id'] for status, body in results if status == 201]
+    if created:
+        print(f'Booked appointment {created[0]}; cancel it before running again')
+    assert statuses[201] == 1, f'expected exactly one 201, got {statuses[201]}'
+    assert statuses[409] == args.requests - 1, f'expected {args.requests - 1} x 409, got {statuses[409]}'
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+import os
+import sqlite3
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from config import Config  # noqa: E402
+
+
+def sqlite_connection():
+    # SQLite has no LEAST/GREATEST, which idx_messages_pair_sent_at and the
+    # conversation queries use
+    conn = sqlite3.connect(':memory:', check_same_thread=False)
+    conn.create_function('least', -1, min, deterministic=True)
+    conn.create_function('greatest', -1, max, deterministic=True)
+    return conn
+
+
+class SQLiteConfig(Config):
+    """In-memory SQLite, one process, fast bcrypt."""
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_ENGINE_OPTIONS = {'creator': sqlite_connection}
+    JWT_SECRET_KEY = 'test-secret-key-of-at-least-32-bytes'
+    BCRYPT_LOG_ROUNDS = 4
+    BLOB_STORAGE_DIR = tempfile.mkdtemp(prefix='blobs-')
+    SOCKETIO_ASYNC_MODE = os.environ.get('TEST_SOCKETIO_ASYNC_MODE', 'threading')
+    SOCKETIO_MESSAGE_QUEUE = None
+    PRESENCE_URL = None
+    REVOKED_TOKENS_URL = None
+
+
+def seed(api):
+    """One doctor with a user account and one patient, both with password 'pw'."""
+    doctor = api.Doctor(name='Dr. Ahmed Ben Ali', specialty='Cardiology', city='Tunis')
+    api.db.session.add(doctor)
+    api.db.session.flush()
+    api.db.session.add_all([
+        api.User(first_name='Ahmed', last_name='Ben Ali', email='doctor@example.com',
+                 password=api.hash_password('pw'), is_doctor=True, doctor_id=doctor.id),
+        api.User(first_name='John', last_name='Doe', email='patient@example.com', password=api.hash_password('pw')),
+    ])
+    api.db.session.commit()
+
+
+@pytest.fixture(scope='session')
+def app():
+    import api
+    app = api.create_app(SQLiteConfig)
+    with app.app_context():
+        api.db.create_all()
+        seed(api)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def login(client, email='patient@example.com'):
+    response = client.post('/api/login', json={'email': email, 'password': 'pw'})
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+
+@pytest.fixture
+def patient(client):
+    return login(client)
+
+
+@pytest.fixture
+def doctor(client):
+    return login(client, 'doctor@example.com')
+
+
+@pytest.fixture
+def new_user(client):
+    """Register a fresh patient; returns (user_id, auth headers, tokens)."""
+    def register():
+        email = f'user-{os.urandom(4).hex()}@example.com'
+        body = client.post('/api/register', json={
+            'first_name': 'Test', 'last_name': 'User', 'email': email, 'password': 'pw'
+        }).get_json()
+        return body['user']['id'], {'Authorization': f"Bearer {body['access_token']}"}, body
+    return register
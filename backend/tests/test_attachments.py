@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.mark.parametrize('content', ['abc', 'YWJjZ', ['YWJj']])
+def test_json_attachment_with_bad_base64(client, patient, content):
+    body = {'name': 'scan.png', 'type': 'file', 'appid': 1, 'content': content}
+    response = client.post('/api/attachments', json=body, headers=patient)
+    assert response.status_code == 400
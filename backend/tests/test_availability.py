@@ -0,0 +1,48 @@
+import pytest
+
+
+@pytest.mark.parametrize('body', [
+    {'doctor_ids': [1], 'days': None},
+    {'doctor_ids': [1], 'days': 'a week'},
+    {'doctor_ids': [1], 'days': [7]},
+    {'doctor_ids': ['x']},
+    {'doctor_ids': [None]},
+    {'doctor_ids': [[1]]},
+    {'doctor_ids': [1.5]},
+    {'doctor_ids': [1], 'start': 20260101},
+    {'doctor_ids': [1], 'start': ['2026-01-01']},
+    {'doctor_ids': [1], 'start': '01/01/2026'},
+    {'doctor_ids': 1},
+    ['doctor_ids'],
+])
+def test_bulk_availability_rejects_bad_input(client, patient, body):
+    response = client.post('/api/doctors/availability', json=body, headers=patient)
+    assert response.status_code == 400
+
+
+def test_bulk_availability(client, patient):
+    response = client.post('/api/doctors/availability', json={'doctor_ids': [1, 1], 'days': 3}, headers=patient)
+    assert response.status_code == 200
+    assert list(response.get_json()) == ['1']
+    assert len(response.get_json()['1']) == 3
+
+
+def test_booking_ignores_a_stale_availability_cache(app, client, patient):
+    from datetime import date, datetime, timedelta
+    import api
+
+    day = date.today() + timedelta(days=1)
+    while day.weekday() > 4:
+        day += timedelta(days=1)
+    with app.app_context():
+        api.load_availability([1], day, 1)
+        # Cancelled on another worker: this worker's cached bitmap still shows the slot booked
+        window_start, (schedule, bitmaps) = api.availability_cache.get(1)
+        bitmaps = {**bitmaps, day: bitmaps.get(day, 0) | 1 << schedule.slot_index(datetime.combine(day, schedule.start))}
+        api.availability_cache.set(1, (window_start, (schedule, bitmaps)))
+
+    slot = datetime.combine(day, schedule.start).strftime('%Y-%m-%d %H:%M')
+    response = client.post('/api/appointments/book', json={'doctor_id': 1, 'appointment_date': slot}, headers=patient)
+    assert response.status_code == 201
+    response = client.post('/api/appointments/book', json={'doctor_id': 1, 'appointment_date': slot}, headers=patient)
+    assert response.status_code == 409
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, MetaData, Table, Text, create_engine, inspect, text
+
+from dbutil import sync_columns
+
+
+def test_sync_columns_adds_columns_and_keeps_constraints_not_relaxed():
+    engine = create_engine('sqlite://')
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE notes (id INTEGER PRIMARY KEY, description TEXT NOT NULL)'))
+    notes = Table('notes', MetaData(), Column('id', Integer, primary_key=True), Column('description', Text), Column('size', Integer))
+
+    sync_columns(engine, notes)
+
+    columns = {column['name']: column for column in inspect(engine).get_columns('notes')}
+    assert 'size' in columns
+    assert columns['description']['nullable'] is False
@@ -0,0 +1,28 @@
+import api
+
+
+def test_stale_index_entries_are_dropped_before_paging(app, client):
+    with app.app_context():
+        api.doctor_index.ensure_fresh()
+        other = api.Doctor(name='Dr. Leila Hmida', specialty='Cardiology', city='Tunis')
+        api.db.session.add(other)
+        api.db.session.commit()
+        api.doctor_index.upsert(other.id, other.name, other.specialty, other.city)
+        # Moved by another worker: this worker's index still has doctor 1 in Tunis
+        api.Doctor.query.filter_by(id=1).update({'city': 'Sfax'})
+        api.db.session.commit()
+
+    try:
+        response = client.get('/api/doctors?city=Tunis&limit=1')
+        body = response.get_json()
+        assert response.status_code == 200
+        assert [doctor['name'] for doctor in body['doctors']] == ['Dr. Leila Hmida']
+
+        # With a cursor, the next page starts after the refilled entry
+        body = client.get('/api/doctors?city=Tunis&limit=1&after=').get_json()
+        assert [doctor['name'] for doctor in body['doctors']] == ['Dr. Leila Hmida']
+        assert body['next_cursor'] is None
+    finally:
+        with app.app_context():
+            api.Doctor.query.filter_by(id=1).update({'city': 'Tunis'})
+            api.db.session.commit()
@@ -0,0 +1,68 @@
+import base64
+import io
+import time
+
+import pytest
+from PIL import Image
+
+from previews import PREVIEW_MAX_SIZE
+
+
+@pytest.fixture
+def document_id(client, patient):
+    data = {'file': (io.BytesIO(b'blood test results'), 'results.txt', 'text/plain'), 'name': 'Results', 'doctor_id': '1'}
+    response = client.post('/api/upload-document', data=data, headers=patient, content_type='multipart/form-data')
+    assert response.status_code == 201
+    return response.get_json()['document_id']
+
+
+def test_document_details_include_content_by_default(client, patient, document_id):
+    body = client.get(f'/api/document/{document_id}', headers=patient).get_json()
+    assert base64.b64decode(body['content']) == b'blood test results'
+    assert body['download_url'] == f'/api/document/{document_id}/download'
+
+
+def test_document_details_without_content(client, patient, document_id):
+    body = client.get(f'/api/document/{document_id}?include_content=0', headers=patient).get_json()
+    assert 'content' not in body
+    download = client.get(body['download_url'], headers=patient)
+    assert download.data == b'blood test results'
+
+
+def upload(client, headers, data, filename, mime_type):
+    form = {'file': (io.BytesIO(data), filename, mime_type), 'name': filename, 'doctor_id': '1'}
+    response = client.post('/api/upload-document', data=form, headers=headers, content_type='multipart/form-data')
+    assert response.status_code == 201
+    return response.get_json()['document_id']
+
+
+def wait_for_preview(client, headers, document_id):
+    for _ in range(100):
+        body = client.get(f'/api/document/{document_id}?include_content=0', headers=headers).get_json()
+        if body['preview_url']:
+            return body['preview_url']
+        time.sleep(0.05)
+    pytest.fail('preview was not rendered')
+
+
+def check_preview(client, headers, document_id):
+    preview_url = wait_for_preview(client, headers, document_id)
+    assert preview_url == f'/api/document/{document_id}/preview'
+    response = client.get(preview_url, headers=headers)
+    assert response.status_code == 200
+    assert response.mimetype == 'image/jpeg'
+    preview = Image.open(io.BytesIO(response.data))
+    assert max(preview.size) <= PREVIEW_MAX_SIZE
+
+
+def test_image_upload_gets_a_preview(client, patient):
+    png = io.BytesIO()
+    Image.new('RGB', (800, 600), 'red').save(png, 'PNG')
+    check_preview(client, patient, upload(client, patient, png.getvalue(), 'scan.png', 'image/png'))
+
+
+def test_pdf_upload_gets_a_first_page_preview(client, patient):
+    fitz = pytest.importorskip('fitz')
+    pdf = fitz.open()
+    pdf.new_page().insert_text((72, 72), 'Blood test results')
+    check_preview(client, patient, upload(client, patient, pdf.tobytes(), 'results.pdf', 'application/pdf'))
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import inspect, text
+
+import api
+
+
+def test_add_favorite_is_idempotent(client, patient):
+    body = {'user_id': 2, 'doctor_id': 1}
+    assert client.post('/api/favorites/add', json=body, headers=patient).status_code == 201
+    assert client.post('/api/favorites/add', json=body, headers=patient).status_code == 200
+    favorites = client.post('/api/favorites', json={'user_id': 2}, headers=patient).get_json()
+    assert [doctor['id'] for doctor in favorites] == [1]
+    assert client.post('/api/favorites/remove', json=body, headers=patient).status_code == 200
+
+
+def test_add_favorite_of_a_missing_doctor(client, patient):
+    response = client.post('/api/favorites/add', json={'user_id': 2, 'doctor_id': 999}, headers=patient)
+    assert response.status_code == 404
+
+
+def test_migrate_creates_unique_favorite_on_an_existing_table(app):
+    with app.app_context():
+        api.db.session.execute(text('DROP INDEX unique_favorite'))
+        api.db.session.execute(text('INSERT INTO favorites (user_id, doctor_id) VALUES (2, 1), (2, 1), (1, 1)'))
+        api.db.session.commit()
+
+        api.migrate_db()
+
+        assert 'unique_favorite' in {index['name'] for index in inspect(api.db.engine).get_indexes('favorites')}
+        assert sorted(api.db.session.query(api.Favorite.user_id, api.Favorite.doctor_id).all()) == [(1, 1), (2, 1)]
+        api.Favorite.query.delete()
+        api.db.session.commit()
+
+
+def test_favorites_status(client, patient):
+    client.post('/api/favorites/add', json={'user_id': 2, 'doctor_id': 1}, headers=patient)
+    response = client.post('/api/favorites/status', json={'doctor_ids': [1, 999]}, headers=patient)
+    assert response.get_json() == {'favorites': {'1': True, '999': False}}
+    client.post('/api/favorites/remove', json={'user_id': 2, 'doctor_id': 1}, headers=patient)
+    response = client.post('/api/favorites/status', json={'doctor_ids': [1]}, headers=patient)
+    assert response.get_json() == {'favorites': {'1': False}}
+
+
+@pytest.mark.parametrize('body', [
+    {'doctor_ids': [[1]]},
+    {'doctor_ids': [{'id': 1}]},
+    {'doctor_ids': ['1']},
+    {'doctor_ids': [True]},
+    {'doctor_ids': list(range(101))},
+    {'doctor_ids': 1},
+    {},
+    [1],
+])
+def test_favorites_status_rejects_bad_input(client, patient, body):
+    response = client.post('/api/favorites/status', json=body, headers=patient)
+    assert response.status_code == 400
+
+
+def test_favorites_status_without_a_body(client, patient):
+    response = client.post('/api/favorites/status', headers=patient)
+    assert response.status_code == 400
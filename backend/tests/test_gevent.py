@@ -0,0 +1,120 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip('gevent')
+
+# The app served the way `python api.py` serves it: gevent picked as async
+# mode, nothing monkey-patched
+SERVER = '''
+import sys
+sys.path[:0] = [{tests!r}, {backend!r}]
+import api
+from conftest import SQLiteConfig, seed
+app = api.create_app(SQLiteConfig)
+with app.app_context():
+    api.db.create_all()
+    seed(api)
+assert api.socketio.async_mode == 'gevent'
+api.socketio.run(app, host='127.0.0.1', port={port})
+'''
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def call(base, method, path, body=None, token=None, timeout=5):
+    request = urllib.request.Request(base + path, method=method, data=json.dumps(body).encode() if body is not None else None)
+    request.add_header('Content-Type', 'application/json')
+    if token:
+        request.add_header('Authorization', f'Bearer {token}')
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+@pytest.fixture
+def gevent_server():
+    tests = os.path.dirname(os.path.abspath(__file__))
+    port = free_port()
+    code = SERVER.format(tests=tests, backend=os.path.dirname(tests), port=port)
+    env = {**os.environ, 'TEST_SOCKETIO_ASYNC_MODE': 'gevent'}
+    process = subprocess.Popen([sys.executable, '-c', code], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base = f'http://127.0.0.1:{port}'
+    try:
+        for _ in range(100):
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+                break
+            except OSError:
+                assert process.poll() is None, 'server exited'
+                time.sleep(0.1)
+        yield base
+    finally:
+        process.kill()
+        process.wait()
+
+
+def next_weekday():
+    day = date.today() + timedelta(days=1)
+    while day.weekday() > 4:
+        day += timedelta(days=1)
+    return day
+
+
+def test_requests_after_a_booking_are_served(gevent_server):
+    status, body = call(gevent_server, 'POST', '/api/login', {'email': 'patient@example.com', 'password': 'pw'})
+    assert status == 200
+    token = body['access_token']
+
+    status, _ = call(gevent_server, 'POST', '/api/appointments/book',
+                     {'doctor_id': 1, 'appointment_date': f'{next_weekday()} 10:00'}, token)
+    assert status == 201
+    # The booking queued notifications for the emitter task; the hub must still serve
+    status, body = call(gevent_server, 'GET', '/api/notifications/unread-count', token=token)
+    assert status == 200
+    assert body['unread_count'] == 1
+
+
+COMMITTER = '''
+import sys
+sys.path.insert(0, {backend!r})
+import gevent
+from flask import Flask
+from flask_socketio import SocketIO
+from groupcommit import GroupCommitter
+
+socketio = SocketIO(Flask(__name__), async_mode='gevent')
+batches = []
+
+def flush(items):
+    batches.append(list(items))
+    return [item * 2 for item in items]
+
+committer = GroupCommitter(socketio, flush, max_batch=10, max_delay=0.05)
+senders = [gevent.spawn(committer.submit, item, 5) for item in range(5)]
+ticks = gevent.spawn(lambda: [gevent.sleep(0.01) for _ in range(3)])
+gevent.joinall(senders + [ticks], timeout=5, raise_error=True)
+assert ticks.successful()
+assert [sender.value for sender in senders] == [0, 2, 4, 6, 8], senders
+assert batches == [[0, 1, 2, 3, 4]], batches
+'''
+
+
+def test_group_commit_under_gevent_does_not_block_the_hub():
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-c', COMMITTER.format(backend=backend)], capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+import socketio
+from flask import Flask
+from flask_socketio import SocketIO
+
+fakeredis = pytest.importorskip('fakeredis')
+
+
+class FakeRedisManager(socketio.RedisManager):
+    """The Redis message queue of SOCKETIO_MESSAGE_QUEUE, on an in-process fake server."""
+
+    def __init__(self, server, **kwargs):
+        self.fake_server = server
+        super().__init__('redis://', **kwargs)
+
+    def _redis_connect(self):
+        self.redis = fakeredis.FakeRedis(server=self.fake_server)
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+
+
+def worker(server):
+    io = SocketIO(Flask(__name__), async_mode='threading', client_manager=FakeRedisManager(server, channel='flask-socketio'))
+    io.server.manager_initialized = True
+    io.server.manager.initialize()  # starts the listener, as the first connection would
+    return io
+
+
+def connect(io, room):
+    """A socket of this worker in `room`; returns the list its packets go to.
+    (The Flask-SocketIO test client refuses to run with a message queue.)"""
+    packets = []
+    io.server._send_eio_packet = lambda eio_sid, eio_packet: packets.append(
+        io.server.packet_class(encoded_packet=eio_packet.data).data)
+    sid = io.server.manager.connect('eio-1', '/')
+    io.server.manager.enter_room(sid, '/', room)
+    return packets
+
+
+def wait_for(packets, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not packets and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return packets
+
+
+def test_emits_reach_sockets_connected_to_another_worker():
+    server = fakeredis.FakeServer()
+    worker_a, worker_b = worker(server), worker(server)
+    packets = connect(worker_a, '7')
+    time.sleep(0.2)  # both listeners subscribed
+
+    # Worker B has no socket in room 8 or 7; the queue carries its emits to worker A
+    worker_b.emit('new_notification', {'user_id': 8}, room='8')
+    worker_b.emit('new_notification', {'user_id': 7}, room='7')
+    assert wait_for(packets) == [['new_notification', {'user_id': 7}]]
@@ -0,0 +1,63 @@
+import pytest
+
+
+@pytest.mark.parametrize('field', ['before_id', 'since_id'])
+@pytest.mark.parametrize('value', ['abc', [1], {'id': 1}])
+def test_message_history_rejects_non_integer_anchors(client, patient, field, value):
+    response = client.post('/api/messages', json={'other_user_id': 1, field: value}, headers=patient)
+    assert response.status_code == 400
+
+
+def test_message_history_accepts_numeric_strings(client, patient):
+    response = client.post('/api/messages', json={'other_user_id': 1, 'before_id': '10'}, headers=patient)
+    assert response.status_code == 200
+    assert response.get_json() == []
+
+
+def test_an_older_message_committed_late_does_not_become_the_last_one(app, client, patient):
+    from datetime import datetime, timedelta
+    import api
+
+    with app.app_context():
+        now = datetime.utcnow()
+        newer = api.Message(id=1001, sender_id=1, receiver_id=2, message_text='newer', sent_at=now)
+        older = api.Message(id=1000, sender_id=2, receiver_id=1, message_text='older', sent_at=now - timedelta(seconds=1))
+        for message in (newer, older):
+            api.db.session.add(message)
+            api.db.session.flush()
+            api.record_message_in_conversation(message)
+        api.db.session.commit()
+
+    conversations = client.get('/api/messages/conversations', headers=patient).get_json()
+    assert conversations[0]['latest_message']['message_text'] == 'newer'
+    # Both messages are still counted as unread, one on each side
+    assert conversations[0]['unread_count'] == 1
+    assert conversations[0]['latest_message']['is_read'] is False
+
+
+def test_message_history_is_complete_unless_the_client_pages(app, client, patient):
+    from datetime import datetime, timedelta
+    import api
+
+    with app.app_context():
+        start = datetime(2020, 1, 1)
+        api.db.session.add_all([
+            api.Message(sender_id=1 + i % 2, receiver_id=2 - i % 2, message_text=f'm{i}', sent_at=start + timedelta(minutes=i))
+            for i in range(60)
+        ])
+        api.db.session.commit()
+
+    history = client.post('/api/messages', json={'other_user_id': 1}, headers=patient).get_json()
+    texts = [message['message_text'] for message in history if message['message_text'].startswith('m')]
+    assert texts == [f'm{i}' for i in range(60)]
+
+    latest = client.post('/api/messages', json={'other_user_id': 1, 'limit': 10}, headers=patient).get_json()
+    assert len(latest) == 10
+    older = client.post('/api/messages', json={'other_user_id': 1, 'limit': 10, 'before_id': history[0]['id']}, headers=patient).get_json()
+    assert older == []
+
+
+@pytest.mark.parametrize('other_user_id', ['abc', [1], {'id': 1}])
+def test_mark_read_rejects_a_non_integer_user(client, patient, other_user_id):
+    response = client.post('/api/messages/mark-read', json={'other_user_id': other_user_id}, headers=patient)
+    assert response.status_code == 400
@@ -0,0 +1,32 @@
+import api
+
+
+def add_notifications(app, count):
+    with app.app_context():
+        for i in range(count):
+            api.add_notification(1, f'Notification {i}')
+        api.db.session.commit()
+
+
+def test_notifications_without_paging_args_are_a_list(app, client, doctor):
+    add_notifications(app, 3)
+    response = client.get('/api/notifications', headers=doctor)
+    assert response.status_code == 200
+    body = response.get_json()
+    assert isinstance(body, list)
+    assert [n['message'] for n in body[:3]] == ['Notification 2', 'Notification 1', 'Notification 0']
+
+
+def test_notifications_page_with_a_cursor(app, client, doctor):
+    add_notifications(app, 3)
+    total = len(client.get('/api/notifications', headers=doctor).get_json())
+    seen = []
+    after = ''
+    while True:
+        body = client.get(f'/api/notifications?after={after}&limit=2', headers=doctor).get_json()
+        assert len(body['notifications']) <= 2
+        seen += [n['id'] for n in body['notifications']]
+        after = body['next_cursor']
+        if not after:
+            break
+    assert len(seen) == len(set(seen)) == total
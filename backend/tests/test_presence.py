@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from presence import LocalPresence, RedisPresence
+
+TTL = 1
+ROOM = 'chat_1_2'
+
+
+@pytest.fixture(params=['local', 'redis'])
+def presence(request):
+    if request.param == 'local':
+        return LocalPresence(ttl=TTL)
+    fakeredis = pytest.importorskip('fakeredis')
+    return RedisPresence(fakeredis.FakeRedis(), ttl=TTL)
+
+
+def test_open_and_close_chat(presence):
+    presence.connect('a', 1)
+    assert not presence.in_chat(1, ROOM)
+    presence.open_chat('a', 1, ROOM)
+    assert presence.in_chat(1, ROOM)
+    assert not presence.in_chat(2, ROOM)
+    presence.close_chat('a', 1, ROOM)
+    assert not presence.in_chat(1, ROOM)
+
+
+def test_chat_stays_open_while_another_socket_has_it(presence):
+    presence.connect('a', 1)
+    presence.connect('b', 1)
+    presence.open_chat('a', 1, ROOM)
+    presence.open_chat('b', 1, ROOM)
+    presence.disconnect('a', 1)
+    assert presence.in_chat(1, ROOM)
+    presence.disconnect('b', 1)
+    assert not presence.in_chat(1, ROOM)
+
+
+def test_presence_lapses_without_activity_and_heartbeat_keeps_it(presence):
+    presence.connect('a', 1)
+    presence.open_chat('a', 1, ROOM)
+    time.sleep(TTL / 2)
+    presence.heartbeat('a', 1)
+    time.sleep(TTL / 2 + 0.1)
+    assert presence.in_chat(1, ROOM)
+    time.sleep(TTL + 0.1)
+    assert not presence.in_chat(1, ROOM)
+    presence.heartbeat('a', 1)
+    assert presence.in_chat(1, ROOM)
+
+
+def test_socket_idle_past_ttl_can_still_open_and_leave_chats(presence):
+    presence.connect('a', 1)
+    time.sleep(TTL + 0.1)
+    presence.open_chat('a', 1, ROOM)
+    assert presence.in_chat(1, ROOM)
+    time.sleep(TTL + 0.1)
+    presence.disconnect('a', 1)
+    presence.connect('b', 1)
+    assert not presence.in_chat(1, ROOM)
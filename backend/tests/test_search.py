@@ -0,0 +1,50 @@
+from search import DoctorSearchIndex, query_trigrams
+
+DOCTORS = [
+    (1, 'Dr. Ahmed Ben Ali', 'Cardiology', 'Tunis'),
+    (2, 'Dr. Sana Trabelsi', 'Dermatology', 'Sfax'),
+    (3, 'Dr. Mohamed Hmida', 'Cardiology', 'Sousse'),
+]
+
+
+def make_index():
+    return DoctorSearchIndex(lambda: DOCTORS)
+
+
+def ids(results):
+    return [doctor_id for _, doctor_id in results]
+
+
+def test_query_trigrams_pads_only_the_front_of_short_words():
+    assert query_trigrams('ah') == {'  a', ' ah'}
+    assert query_trigrams('ahm') == {'ahm'}
+
+
+def test_substring_and_fuzzy_matches():
+    index = make_index()
+    assert ids(index.search(name='ahmed')) == [1]
+    assert ids(index.search(name='trabelsy')) == [2]
+
+
+def test_short_term_matches_inside_a_name():
+    index = make_index()
+    # "hm" starts no word, so only the substring scan finds these
+    assert sorted(ids(index.search(name='hm'))) == [1, 3]
+    assert ids(index.search(name='hm', city='Sousse')) == [3]
+
+
+def test_filters_without_a_name():
+    index = make_index()
+    assert ids(index.search(specialty='cardiology')) == [1, 3]
+    assert ids(index.search(specialty='Cardiology', city='tunis')) == [1]
+
+
+def test_short_terms_come_from_the_short_piece_postings():
+    index = make_index()
+    index.ensure_fresh()
+    # The postings hold the candidates; no other name is looked at
+    assert index._short['hm'] == {1, 3}
+    index.remove(3)
+    assert index._short['hm'] == {1}
+    assert ids(index.search(name='hm')) == [1]
+    assert ids(index.search(name='el')) == [2]
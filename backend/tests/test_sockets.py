@@ -0,0 +1,81 @@
+import pytest
+
+import api
+
+
+@pytest.fixture
+def socket(app, patient):
+    token = patient['Authorization'].split()[1]
+    client = api.socketio.test_client(app, auth={'token': token})
+    assert client.is_connected()
+    yield client
+    client.disconnect()
+
+
+@pytest.mark.parametrize('auth', ['abc', ['abc'], 7, {}, {'token': 'abc'}])
+def test_connect_with_bad_auth_is_refused(app, auth):
+    client = api.socketio.test_client(app, auth=auth)
+    assert not client.is_connected()
+
+
+def errors(client):
+    return [event['args'][0] for event in client.get_received() if event['name'] == 'error']
+
+
+@pytest.mark.parametrize('payload', ['abc', None, {'user_id': 2}, [2], '2.0', -2])
+def test_join_with_a_bad_user_id(socket, payload):
+    socket.emit('join', payload)
+    assert errors(socket) == [{'message': 'Unauthorized'}]
+
+
+def test_join_with_the_socket_user(socket):
+    socket.emit('join', '2')
+    socket.emit('join', 2)
+    assert errors(socket) == []
+
+
+@pytest.mark.parametrize('event', ['join_chat', 'leave_chat'])
+@pytest.mark.parametrize('payload', ['chat_1_2', None, ['chat_1_2'], 7])
+def test_chat_events_with_a_payload_that_is_not_an_object(socket, event, payload):
+    socket.emit(event, payload)
+    assert socket.is_connected()
+    assert errors(socket) == ([{'message': 'Invalid chat room'}] if event == 'join_chat' else [])
+
+
+def test_join_chat(app, socket):
+    socket.emit('join_chat', {'room': 'chat_1_2'})
+    assert errors(socket) == []
+    assert app.extensions['presence'].in_chat(2, 'chat_1_2')
+    socket.emit('leave_chat', {'room': 'chat_1_2'})
+    assert not app.extensions['presence'].in_chat(2, 'chat_1_2')
+
+
+def test_send_message_acks_the_saved_message(socket):
+    ack = socket.emit('send_message', {'receiver_id': 1, 'message_text': 'Hello'}, callback=True)
+    assert ack['status'] == 'ok'
+    assert ack['message']['id'] == ack['message_id']
+    assert ack['message']['message_text'] == 'Hello'
+    received = [event['args'][0] for event in socket.get_received() if event['name'] == 'new_message']
+    assert [message['id'] for message in received] == [ack['message_id']]
+
+
+@pytest.mark.parametrize('payload', [
+    {'receiver_id': 1},
+    {'receiver_id': 1, 'message_text': ['Hello']},
+    {'receiver_id': 1, 'message_text': 7},
+    {'receiver_id': 1, 'message_text': '   '},
+    {'receiver_id': 'abc', 'message_text': 'Hello'},
+    {'receiver_id': 2, 'message_text': 'Hello'},
+    {'receiver_id': 9999, 'message_text': 'Hello'},
+    'Hello',
+])
+def test_send_message_with_a_bad_payload(socket, payload):
+    ack = socket.emit('send_message', payload, callback=True)
+    assert ack['status'] == 'error'
+    assert socket.is_connected()
+
+
+def test_a_bad_item_does_not_fail_its_batch(app):
+    results = api.insert_message_batch(app, [(2, 1, 'first'), (9999, 1, 'gone sender'), (2, 9999, 'gone receiver'), (1, 2, 'last')])
+    assert results[1] is None and results[2] is None
+    assert [message['message_text'] for message in (results[0], results[3])] == ['first', 'last']
@@ -0,0 +1,48 @@
+from flask_jwt_extended import create_access_token, decode_token
+
+import api
+from conftest import login
+
+
+def tokens(client, email='patient@example.com'):
+    return client.post('/api/login', json={'email': email, 'password': 'pw'}).get_json()
+
+
+def bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_refresh_token_only_works_for_refreshing(app, client):
+    body = tokens(client)
+    assert client.get('/api/notifications/unread-count', headers=bearer(body['refresh_token'])).status_code == 422
+    assert client.post('/api/token/refresh', headers=bearer(body['access_token'])).status_code == 422
+
+    response = client.post('/api/token/refresh', headers=bearer(body['refresh_token']))
+    assert response.status_code == 200
+    access_token = response.get_json()['access_token']
+    with app.app_context():
+        claims = decode_token(access_token)
+    assert (claims['type'], claims['sub'], claims['is_doctor']) == ('access', '2', False)
+    assert client.get('/api/notifications/unread-count', headers=bearer(access_token)).status_code == 200
+
+
+def test_logged_out_tokens_are_refused(client):
+    body = tokens(client)
+    assert client.post('/api/logout', headers=bearer(body['access_token'])).status_code == 200
+    assert client.get('/api/notifications/unread-count', headers=bearer(body['access_token'])).status_code == 401
+
+    assert client.post('/api/logout', headers=bearer(body['refresh_token'])).status_code == 200
+    assert client.post('/api/token/refresh', headers=bearer(body['refresh_token'])).status_code == 401
+    # Other sessions of the same user are not affected
+    assert client.get('/api/notifications/unread-count', headers=login(client)).status_code == 200
+
+
+def test_access_token_without_role_claims_loads_the_user(app, client):
+    with app.app_context():
+        old_doctor_token = create_access_token(identity='1')
+        old_patient_token = create_access_token(identity='2')
+        assert 'is_doctor' not in decode_token(old_doctor_token)
+
+    body = {'doctor_id': 1}
+    assert client.post('/api/doctor-appointments', json=body, headers=bearer(old_doctor_token)).status_code == 200
+    assert client.post('/api/doctor-appointments', json=body, headers=bearer(old_patient_token)).status_code == 403
@@ -0,0 +1,35 @@
+import api
+
+
+def test_send_count_mark_read_round_trip(app, client, new_user):
+    alice, alice_headers, alice_tokens = new_user()
+    bob, bob_headers, _ = new_user()
+    socket = api.socketio.test_client(app, auth={'token': alice_tokens['access_token']})
+
+    assert client.get('/api/messages/unread-count', headers=alice_headers).get_json() == {'unread_total': 0}
+    for text in ('hello', 'are you there?'):
+        response = client.post('/api/messages/send', json={'receiver_id': alice, 'message_text': text}, headers=bob_headers)
+        assert response.status_code == 201
+    # The cached total was dropped by the sends
+    assert client.get('/api/messages/unread-count', headers=alice_headers).get_json() == {'unread_total': 2}
+
+    conversations = client.get('/api/messages/conversations', headers=alice_headers).get_json()
+    assert [(c['user_id'], c['unread_count']) for c in conversations] == [(bob, 2)]
+    bob_side = client.get('/api/messages/conversations', headers=bob_headers).get_json()
+    assert bob_side[0]['unread_count'] == 0
+    assert bob_side[0]['latest_message'] == {**bob_side[0]['latest_message'], 'from_me': True, 'is_read': False}
+
+    socket.get_received()
+    body = client.post('/api/messages/mark-read', json={'other_user_id': bob}, headers=alice_headers).get_json()
+    assert body['updated'] == 2
+    assert body['unread_total'] == 0
+    [event] = [event for event in socket.get_received() if event['name'] == 'messages_read']
+    assert event['args'][0]['other_user_id'] == bob
+    assert event['args'][0]['updated'] == 2
+    assert event['args'][0]['unread_total'] == 0
+
+    assert client.get('/api/messages/unread-count', headers=alice_headers).get_json() == {'unread_total': 0}
+    assert client.get('/api/messages/conversations', headers=bob_headers).get_json()[0]['latest_message']['is_read'] is True
+    # Nothing left to mark
+    assert client.post('/api/messages/mark-read', json={'other_user_id': bob}, headers=alice_headers).get_json()['updated'] == 0
+    socket.disconnect()
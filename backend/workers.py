@@ -0,0 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+def native_executor(max_workers):
+    """Executor backed by real OS threads, even under gevent.
+
+    Gunicorn's gevent worker monkey-patches `threading`, which turns a plain
+    ThreadPoolExecutor into greenlets that still block the hub on CPU-bound
+    calls. gevent's own executor runs on native threads and its futures wait
+    cooperatively, so the event loop keeps serving requests meanwhile.
+    """
+    try:
+        from gevent import monkey
+        if monkey.is_module_patched('threading'):
+            from gevent.threadpool import ThreadPoolExecutor as GeventThreadPoolExecutor
+            return GeventThreadPoolExecutor(max_workers=max_workers)
+    except ImportError:
+        pass
+    return ThreadPoolExecutor(max_workers=max_workers)
@@ -14,7 +14,7 @@ export class AddAttachmentPage implements OnInit {
   attachmentType: 'note' | 'file' = 'note'; 
   attachmentName: string = '';
   attachmentDescription: string = '';
-  attachmentContent: string = '';
+  attachmentFile: File | null = null;
   doctorId:number|null=null;
 
   constructor(
@@ -41,35 +41,33 @@ export class AddAttachmentPage implements OnInit {
   }
 
   onTypeChange() {
-    this.attachmentContent = '';
+    this.attachmentFile = null;
   }
 
   onFileSelected(event: any) {
     const file: File = event.target.files[0];
     if (file) {
       this.attachmentName = file.name;
-      const reader = new FileReader();
-      reader.onload = () => {
-        this.attachmentContent = (reader.result as string).split(',')[1];
-      };
-      reader.readAsDataURL(file);
+      this.attachmentFile = file;
     }
   }
 
   isFormValid(): boolean {
     if (!this.attachmentName || !this.attachmentType) return false;
-    if (this.attachmentType === 'file' && !this.attachmentContent) return false;
+    if (this.attachmentType === 'file' && !this.attachmentFile) return false;
     return true;
   }
 
   addAttachment() {
-    const attachmentData = {
-      name: this.attachmentName,
-      type: this.attachmentType,
-      description: this.attachmentDescription,
-      content: this.attachmentType === 'note' ? 'note' : this.attachmentContent, 
-      appid: this.appointmentId
-    };
+    // Files go as multipart so the server can stream them to disk
+    const attachmentData = new FormData();
+    attachmentData.append('name', this.attachmentName);
+    attachmentData.append('type', this.attachmentType);
+    attachmentData.append('description', this.attachmentDescription);
+    attachmentData.append('appid', String(this.appointmentId));
+    if (this.attachmentType === 'file' && this.attachmentFile) {
+      attachmentData.append('file', this.attachmentFile);
+    }
 
     this.doctorService.addAttachment(attachmentData).subscribe({
       next: () => {
@@ -85,6 +83,6 @@ export class AddAttachmentPage implements OnInit {
     this.attachmentType = 'note';
     this.attachmentName = '';
     this.attachmentDescription = '';
-    this.attachmentContent = '';
+    this.attachmentFile = null;
   }
 }
\ No newline at end of file
@@ -66,7 +66,7 @@ export class AppComponent implements OnInit, OnDestroy {
     private router: Router,
     private platform: Platform
   ) {
-    this.socket = io('http://localhost:5000', { autoConnect: false });
+    this.socket = io('http://localhost:5000', { autoConnect: false, transports: ['websocket'] });
     this.initializeApp();
   }
 
@@ -177,7 +177,7 @@ export class AppComponent implements OnInit, OnDestroy {
     const token = this.authService.getToken();
     const userId = this.authService.getUser().id;
 
-    this.socket.auth = { token };
+    this.socket.auth = (cb) => cb({ token: this.authService.getToken() });
     this.socket.connect();
 
     this.socket.on('connect', () => {
@@ -187,6 +187,7 @@ export class AppComponent implements OnInit, OnDestroy {
 
     this.socket.on('connect_error', (err) => {
       console.error('SocketIO connection error:', err);
+      this.authService.handleSocketConnectError(this.socket, err);
     });
 
     this.socket.on('new_notification', (notification) => {
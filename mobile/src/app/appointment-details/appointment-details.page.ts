@@ -119,10 +119,19 @@ export class AppointmentDetailsPage implements OnInit {
   }
 
   downloadAttachment(attachment: any) {
-    const link = document.createElement('a');
-    link.href = `data:application/octet-stream;base64,${attachment.content}`;
-    link.download = attachment.extension ? `${attachment.name}${attachment.extension}` : attachment.name;
-    link.click();
+    this.doctorService.downloadAttachment(attachment.id).subscribe({
+      next: (blob) => {
+        const url = URL.createObjectURL(blob);
+        const link = document.createElement('a');
+        link.href = url;
+        link.download = attachment.name;
+        link.click();
+        URL.revokeObjectURL(url);
+      },
+      error: (err) => {
+        console.error('Error downloading attachment:', err);
+      }
+    });
   }
 
   toggleDescription(attachmentId: number) {
@@ -1,7 +1,7 @@
 import { Injectable } from '@angular/core';
 import { HttpRequest, HttpHandler, HttpEvent, HttpInterceptor, HttpErrorResponse } from '@angular/common/http';
 import { Observable, throwError } from 'rxjs';
-import { catchError } from 'rxjs/operators';
+import { catchError, switchMap } from 'rxjs/operators';
 
 import { Router } from '@angular/router';
 import { AuthService } from './services/auth.service';
@@ -15,7 +15,9 @@ export class AuthInterceptor implements HttpInterceptor {
 
   intercept(request: HttpRequest<any>, next: HttpHandler): Observable<HttpEvent<any>> {
     const token = this.authService.getToken();
-    if (token) {
+    // Refresh and logout calls carry their own refresh token
+    const usesRefreshToken = request.url.endsWith('/token/refresh') || request.url.endsWith('/logout');
+    if (token && !usesRefreshToken) {
       request = request.clone({
         setHeaders: {
           Authorization: `Bearer ${token}`
@@ -28,13 +30,26 @@ export class AuthInterceptor implements HttpInterceptor {
         if (error.status === 401) {
           // Check if error is due to expired token
           if (error.error && error.error.msg === 'Token has expired') {
-            console.log('Token expired, logging out...');
-            this.authService.logout();
-            this.router.navigate(['/login']);
+            if (!usesRefreshToken && this.authService.getRefreshToken()) {
+              return this.authService.refreshAccessToken().pipe(
+                switchMap(newToken => next.handle(request.clone({ setHeaders: { Authorization: `Bearer ${newToken}` } }))),
+                catchError(refreshError => {
+                  this.expireSession();
+                  return throwError(() => refreshError);
+                })
+              );
+            }
+            this.expireSession();
           }
         }
         return throwError(() => error);
       })
     );
   }
+
+  private expireSession() {
+    console.log('Token expired, logging out...');
+    this.authService.logout();
+    this.router.navigate(['/login']);
+  }
 }
\ No newline at end of file
@@ -1,4 +1,4 @@
-import { Component, OnInit } from '@angular/core';
+import { Component, OnInit, OnDestroy } from '@angular/core';
 import { ActivatedRoute } from '@angular/router';
 import { DoctorService } from '../services/doctor.service';
 import { AuthService } from '../services/auth.service';
@@ -9,9 +9,10 @@ import { AuthService } from '../services/auth.service';
   styleUrls: ['./document-details.page.scss'],
   standalone: false
 })
-export class DocumentDetailsPage implements OnInit {
+export class DocumentDetailsPage implements OnInit, OnDestroy {
   isDoctor: boolean | null = null;
   document: any = null;
+  previewSrc: string | null = null;
   loading: boolean = true;
   newNote: string = ''; 
   editingNoteId: number | null = null; 
@@ -32,12 +33,21 @@ export class DocumentDetailsPage implements OnInit {
     }
   }
 
+  ngOnDestroy() {
+    if (this.previewSrc) {
+      window.URL.revokeObjectURL(this.previewSrc);
+    }
+  }
+
   loadDocument(documentId: number) {
     this.loading = true;
     this.doctorService.getDocumentDetails(documentId).subscribe({
       next: (data) => {
         this.document = data;
         this.loading = false;
+        if (data.preview_url) {
+          this.loadPreview(documentId);
+        }
       },
       error: (err) => {
         console.error('Error loading document:', err);
@@ -47,6 +57,18 @@ export class DocumentDetailsPage implements OnInit {
     });
   }
 
+  // Small thumbnail rendered by the server; the file itself is only fetched on download
+  loadPreview(documentId: number) {
+    this.doctorService.getDocumentPreview(documentId).subscribe({
+      next: (blob) => {
+        this.previewSrc = window.URL.createObjectURL(blob);
+      },
+      error: (err) => {
+        console.error('Error loading preview:', err);
+      }
+    });
+  }
+
   addNote() {
     if (!this.document || !this.isDoctor || !this.newNote.trim()) return;
 
@@ -111,23 +133,23 @@ export class DocumentDetailsPage implements OnInit {
   }
 
   downloadFile() {
-    if (!this.document || !this.document.content || !this.document.extension) {
+    if (!this.document || !this.document.download_url) {
       return;
     }
 
-    const byteCharacters = atob(this.document.content);
-    const byteNumbers = new Array(byteCharacters.length);
-    for (let i = 0; i < byteCharacters.length; i++) {
-      byteNumbers[i] = byteCharacters.charCodeAt(i);
-    }
-    const byteArray = new Uint8Array(byteNumbers);
-    const blob = new Blob([byteArray], { type: this.getMimeType(this.document.extension) });
-
-    const link = document.createElement('a');
-    link.href = window.URL.createObjectURL(blob);
-    link.download = `${this.document.name}${this.document.extension}`;
-    link.click();
-    window.URL.revokeObjectURL(link.href);
+    this.doctorService.downloadDocument(this.document.id).subscribe({
+      next: (data) => {
+        const blob = new Blob([data], { type: this.document.mime_type || this.getMimeType(this.document.extension || '') });
+        const link = document.createElement('a');
+        link.href = window.URL.createObjectURL(blob);
+        link.download = `${this.document.name}${this.document.extension || ''}`;
+        link.click();
+        window.URL.revokeObjectURL(link.href);
+      },
+      error: (err) => {
+        console.error('Error downloading document:', err);
+      }
+    });
   }
 
   getMimeType(extension: string): string {
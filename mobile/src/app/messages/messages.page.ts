@@ -23,6 +23,7 @@ export class MessagesPage implements OnInit, OnDestroy {
   currentUser: any;
   loading: boolean = false;
   private socket: Socket;
+  private heartbeatTimer: any = null;
   private keyboardHeight: number = 0;
 
   constructor(
@@ -32,8 +33,10 @@ export class MessagesPage implements OnInit, OnDestroy {
     private route: ActivatedRoute
   ) {
     const token = this.authService.getToken();
+    // The server authenticates the socket once, on connect; read the token on each (re)connect
     this.socket = io('https://doctor-finder-3lrk.onrender.com', {
-      auth: { token: token }
+      auth: (cb) => cb({ token: this.authService.getToken() }),
+      transports: ['websocket']
     });
 
     this.socket.on('connect', () => {
@@ -45,6 +48,7 @@ export class MessagesPage implements OnInit, OnDestroy {
 
     this.socket.on('connect_error', (err) => {
       console.error('WebSocket connection error:', err);
+      this.authService.handleSocketConnectError(this.socket, err);
     });
 
     this.socket.on('error', (data) => {
@@ -162,12 +166,25 @@ export class MessagesPage implements OnInit, OnDestroy {
     }
 
     console.log('Sending message to:', this.otherUserId);
+    const onSent = () => {
+      this.newMessage = '';
+      this.scrollToBottom();
+      setTimeout(() => this.messageInput?.setFocus(), 100);
+    };
+    if (this.socket.connected) {
+      // The ack arrives once the message is saved; new_message then adds it to the list
+      this.socket.timeout(10000).emit('send_message', { receiver_id: this.otherUserId, message_text: this.newMessage }, (err: any, ack: any) => {
+        if (!err && ack?.status === 'ok') {
+          onSent();
+        } else {
+          console.error('Send message error:', err || ack);
+          this.presentToast('Failed to send message', 'danger');
+        }
+      });
+      return;
+    }
     this.doctorService.sendMessage(this.otherUserId, this.newMessage).subscribe({
-      next: () => {
-        this.newMessage = '';
-        this.scrollToBottom();
-        setTimeout(() => this.messageInput?.setFocus(), 100);
-      },
+      next: onSent,
       error: (err) => {
         console.error('Send message error:', err);
         this.presentToast('Failed to send message', 'danger');
@@ -224,6 +241,9 @@ export class MessagesPage implements OnInit, OnDestroy {
     const chatRoom = this.getChatRoomName(this.currentUser.id, this.otherUserId);
     this.socket.emit('join_chat', { room: chatRoom });
     console.log(`Joined chat room: ${chatRoom}`);
+    // Keeps the server's presence entry alive so no notification is created while the chat is open
+    clearInterval(this.heartbeatTimer);
+    this.heartbeatTimer = setInterval(() => this.socket.emit('heartbeat'), 60000);
   }
 
   leaveChatRoom() {
@@ -231,6 +251,8 @@ export class MessagesPage implements OnInit, OnDestroy {
     const chatRoom = this.getChatRoomName(this.currentUser.id, this.otherUserId);
     this.socket.emit('leave_chat', { room: chatRoom });
     console.log(`Left chat room: ${chatRoom}`);
+    clearInterval(this.heartbeatTimer);
+    this.heartbeatTimer = null;
   }
 
   getChatRoomName(userId: number, otherUserId: number): string {
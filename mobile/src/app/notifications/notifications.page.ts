@@ -3,6 +3,7 @@ import { AuthService } from '../services/auth.service';
 import { io, Socket } from 'socket.io-client';
 import { NavController } from '@ionic/angular';
 import { Router } from '@angular/router';
+import { Subscription } from 'rxjs';
 
 @Component({
   selector: 'app-notifications',
@@ -14,7 +15,9 @@ export class NotificationsPage implements OnInit, OnDestroy {
   notifications: any[] = [];
   unreadCount: number = 0;
   expandedNotifications: Set<number> = new Set();
+  nextCursor: string | null = null;
   private socket: Socket;
+  private unreadCountSubscription: Subscription | undefined;
   
 
   constructor(
@@ -22,16 +25,20 @@ export class NotificationsPage implements OnInit, OnDestroy {
     private navCtrl: NavController,
     private router: Router
   ) {
-    this.socket = io('https://doctor-finder-3lrk.onrender.com', { autoConnect: false });
+    this.socket = io('https://doctor-finder-3lrk.onrender.com', { autoConnect: false, transports: ['websocket'] });
   }
 
   ngOnInit() {
+    this.unreadCountSubscription = this.authService.unreadCount$.subscribe(count => this.unreadCount = count);
     this.loadNotifications();
     this.setupSocket();
   }
 
   ngOnDestroy() {
     this.socket.disconnect();
+    if (this.unreadCountSubscription) {
+      this.unreadCountSubscription.unsubscribe();
+    }
   }
 
   loadNotifications() {
@@ -41,9 +48,11 @@ export class NotificationsPage implements OnInit, OnDestroy {
       return;
     }
 
+    // Newest first from the server; later pages are fetched with next_cursor
     this.authService.getNotifications().subscribe({
       next: (data) => {
-        this.notifications = data.sort((a: { created_at: string | number | Date; }, b: { created_at: string | number | Date; }) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime());
+        this.notifications = data.notifications;
+        this.nextCursor = data.next_cursor;
         this.updateUnreadCount();
       },
       error: (err) => {
@@ -52,12 +61,42 @@ export class NotificationsPage implements OnInit, OnDestroy {
     });
   }
 
+  loadMoreNotifications(event: any) {
+    if (!this.nextCursor) {
+      event.target.complete();
+      return;
+    }
+    this.authService.getNotifications(this.nextCursor).subscribe({
+      next: (data) => {
+        const known = new Set(this.notifications.map(n => n.id));
+        this.notifications.push(...data.notifications.filter((n: any) => !known.has(n.id)));
+        this.nextCursor = data.next_cursor;
+        event.target.complete();
+      },
+      error: (err) => {
+        console.error('Error loading more notifications:', err);
+        event.target.complete();
+      },
+    });
+  }
+
+  markAllAsRead() {
+    this.authService.markAllNotificationsAsRead().subscribe({
+      next: () => {
+        this.notifications.forEach(n => n.is_read = true);
+      },
+      error: (err) => {
+        console.error('Error marking all as read:', err);
+      },
+    });
+  }
+
   setupSocket() {
     if (!this.authService.isLoggedIn()) return;
     const token = this.authService.getToken();
     const userId = this.authService.getUser().id;
 
-    this.socket.auth = { token };
+    this.socket.auth = (cb) => cb({ token: this.authService.getToken() });
     this.socket.connect();
 
     this.socket.on('connect', () => {
@@ -67,6 +106,7 @@ export class NotificationsPage implements OnInit, OnDestroy {
 
     this.socket.on('connect_error', (err) => {
       console.error('SocketIO connection error:', err);
+      this.authService.handleSocketConnectError(this.socket, err);
     });
 
     this.socket.on('new_notification', (notification) => {
@@ -94,7 +134,6 @@ export class NotificationsPage implements OnInit, OnDestroy {
   }
 
   updateUnreadCount() {
-    this.unreadCount = this.notifications.filter(n => !n.is_read).length;
     this.authService.loadUnreadCount();
   }
 
@@ -1,7 +1,8 @@
 import { Injectable } from '@angular/core';
 import { HttpClient, HttpHeaders } from '@angular/common/http';
 import { BehaviorSubject, Observable, throwError } from 'rxjs';
-import { catchError, tap } from 'rxjs/operators';
+import { catchError, map, tap } from 'rxjs/operators';
+import { Socket } from 'socket.io-client';
 
 @Injectable({
   providedIn: 'root'
@@ -21,7 +22,7 @@ export class AuthService {
   login(email: string, password: string): Observable<any> {
     return this.http.post<any>(`${this.apiUrl}/login`, { email, password }).pipe(
       tap(response => {
-        this.setLoggedIn(true, response.user, response.access_token);
+        this.setLoggedIn(true, response.user, response.access_token, response.refresh_token);
         this.userSubject.next(response.user);
         this.loadUnreadCount(); 
       })
@@ -31,7 +32,7 @@ export class AuthService {
   register(userData: any): Observable<any> {
     return this.http.post<any>(`${this.apiUrl}/register`, userData).pipe(
       tap(response => {
-        this.setLoggedIn(true, response.user, response.access_token);
+        this.setLoggedIn(true, response.user, response.access_token, response.refresh_token);
         this.userSubject.next(response.user);
         this.loadUnreadCount(); 
       })
@@ -39,9 +40,16 @@ export class AuthService {
   }
 
   logout(): void {
+    const refreshToken = this.getRefreshToken();
+    if (refreshToken) {
+      // Revoke the long-lived token server side, best effort
+      const headers = new HttpHeaders().set('Authorization', `Bearer ${refreshToken}`);
+      this.http.post(`${this.apiUrl}/logout`, {}, { headers }).subscribe({ error: () => {} });
+    }
     localStorage.removeItem('isLoggedIn');
     localStorage.removeItem('user');
     localStorage.removeItem('access_token');
+    localStorage.removeItem('refresh_token');
     this.isLoggedInSubject.next(false);
     this.userSubject.next(null);
     this.unreadCountSubject.next(0); 
@@ -55,7 +63,7 @@ export class AuthService {
     return JSON.parse(localStorage.getItem('user') || '{}');
   }
 
-  setLoggedIn(isLoggedIn: boolean, user?: any, token?: string): void {
+  setLoggedIn(isLoggedIn: boolean, user?: any, token?: string, refreshToken?: string): void {
     localStorage.setItem('isLoggedIn', isLoggedIn.toString());
     if (user) {
       localStorage.setItem('user', JSON.stringify(user));
@@ -63,6 +71,9 @@ export class AuthService {
     if (token) {
       localStorage.setItem('access_token', token);
     }
+    if (refreshToken) {
+      localStorage.setItem('refresh_token', refreshToken);
+    }
     this.isLoggedInSubject.next(isLoggedIn);
   }
 
@@ -70,6 +81,33 @@ export class AuthService {
     return localStorage.getItem('access_token');
   }
 
+  getRefreshToken(): string | null {
+    return localStorage.getItem('refresh_token');
+  }
+
+  refreshAccessToken(): Observable<string> {
+    const headers = new HttpHeaders().set('Authorization', `Bearer ${this.getRefreshToken()}`);
+    return this.http.post<any>(`${this.apiUrl}/token/refresh`, {}, { headers }).pipe(
+      map(response => {
+        localStorage.setItem('access_token', response.access_token);
+        return response.access_token;
+      })
+    );
+  }
+
+  // The server refuses a socket whose access token expired; refresh it and
+  // reconnect (socket.auth reads the token again on every attempt)
+  handleSocketConnectError(socket: Socket, err: Error): void {
+    if (err.message !== 'Token has expired' || !this.getRefreshToken()) return;
+    this.refreshAccessToken().subscribe({
+      next: () => socket.connect(),
+      error: (refreshError) => {
+        console.error('Could not refresh token for SocketIO:', refreshError);
+        this.logout();
+      }
+    });
+  }
+
   isDoctor(): boolean {
     const user = this.getUser();
     return user.is_doctor || false;
@@ -91,9 +129,16 @@ export class AuthService {
     );
   }
 
-  getNotifications(): Observable<any> {
+  getNotifications(after: string = '', limit: number = 20): Observable<any> {
+    const headers = new HttpHeaders().set('Authorization', `Bearer ${this.getToken()}`);
+    return this.http.get<any>(`${this.apiUrl}/notifications`, { headers, params: { after, limit } });
+  }
+
+  markAllNotificationsAsRead(): Observable<any> {
     const headers = new HttpHeaders().set('Authorization', `Bearer ${this.getToken()}`);
-    return this.http.get<any>(`${this.apiUrl}/notifications`, { headers });
+    return this.http.post<any>(`${this.apiUrl}/notifications/read`, { all: true }, { headers }).pipe(
+      tap(() => this.loadUnreadCount())
+    );
   }
 
   markNotificationAsRead(notificationId: number): Observable<any> {
@@ -140,9 +185,10 @@ export class AuthService {
       this.unreadCountSubject.next(0);
       return;
     }
-    this.getNotifications().subscribe({
+    const headers = new HttpHeaders().set('Authorization', `Bearer ${this.getToken()}`);
+    this.http.get<any>(`${this.apiUrl}/notifications/unread-count`, { headers }).subscribe({
       next: (data) => {
-        const count = data.filter((n: { is_read: any; }) => !n.is_read).length;
+        const count = data.unread_count;
         this.unreadCountSubject.next(count);
         console.log('Unread count updated:', count);
       },
@@ -271,6 +271,15 @@ export class DoctorService {
     );
   }
 
+  downloadAttachment(attachmentId: number): Observable<Blob> {
+    return this.http.get(`${this.apiUrl}/attachments/${attachmentId}/download`, { headers: this.getHeaders(), responseType: 'blob' }).pipe(
+      catchError(err => {
+        console.error('Error downloading attachment:', err);
+        return throwError(() => new Error('Failed to download attachment'));
+      })
+    );
+  }
+
   deleteAttachment(attachmentId: number): Observable<any> {
     return this.http.delete(`${this.apiUrl}/attachments/${attachmentId}`, { headers: this.getHeaders() }).pipe(
       catchError(err => {
@@ -296,10 +305,24 @@ export class DoctorService {
     return this.http.get(`${this.apiUrl}/recent-doctors`);
   }
 
+  downloadDocument(documentId: number): Observable<Blob> {
+    return this.http.get(`${this.apiUrl}/document/${documentId}/download`, { headers: this.getHeaders(), responseType: 'blob' }).pipe(
+      catchError(err => {
+        console.error('Error downloading document:', err);
+        return throwError(() => new Error('Failed to download document'));
+      })
+    );
+  }
+
+  getDocumentPreview(documentId: number): Observable<Blob> {
+    return this.http.get(`${this.apiUrl}/document/${documentId}/preview`, { headers: this.getHeaders(), responseType: 'blob' });
+  }
+
   getDocumentDetails(documentId: number): Observable<any> {
     const token = localStorage.getItem('token');
     const headers = new HttpHeaders().set('Authorization', `Bearer ${token}`);
-    return this.http.get(`${this.apiUrl}/document/${documentId}`, { headers });
+    // The file comes from downloadDocument, not as base64 in the details
+    return this.http.get(`${this.apiUrl}/document/${documentId}`, { headers, params: { include_content: 0 } });
   }
   addDocumentNote(documentId: number, content: string): Observable<any> {
     const token = localStorage.getItem('token');